@@ -1,12 +1,105 @@
 from mcp.server.fastmcp import FastMCP
-import spotify
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+# Bind the Spotify functions once at import, so each tool call is a single global
+# lookup instead of a module attribute access.
+from spotify import (
+    search as _search,
+    start_playback as _start_playback,
+    get_current_user as _get_current_user,
+    pause_playback as _pause,
+    resume_playback as _resume,
+    next_track as _next,
+    previous_track as _prev,
+    get_user_playlists as _playlists,
+    set_volume as _set_volume,
+    get_current_playback as _current,
+    clear_search_cache as _clear_search_cache,
+    warm_up as _warm_up,
+    close as _close_client,
+)
 
 # 🚀 Initialize the FastMCP server for Spotify integration
 # -------------------------------------------------------
 # This instance acts as the entry point for all Spotify-related tools.
 # The FastMCP framework allows you to easily expose Python functions as API endpoints or tools.
 # Here, we name our MCP instance "SpotifyMCP" for clarity and identification.
-mcp = FastMCP("SpotifyMCP")
+# The lifespan hook warms up the Spotify connection in the background, inside the
+# server's event loop, without holding up the client's initialize handshake (the
+# access token itself is already loaded when the 'spotify' module is imported).
+# FastMCP enters the lifespan once per session (e.g. per SSE connection), so the
+# shared resources are only released when the last active session ends.
+_active_sessions = 0
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    global _active_sessions
+    _active_sessions += 1
+    warm_up = asyncio.create_task(_warm_up())
+    try:
+        yield
+    finally:
+        _active_sessions -= 1
+        warm_up.cancel()
+        if _active_sessions == 0:
+            if _playback_fetch is not None:
+                _playback_fetch.cancel()
+            _invalidate_playback()
+            await _close_client()
+
+mcp = FastMCP("SpotifyMCP", lifespan=_lifespan)
+
+# 📡 Shared playback cache
+# ------------------------------------------------------------------------
+# Clients tend to poll current_playback every few seconds for a "now playing"
+# view. Reads are served from a cached (timestamp, result) pair and only go to
+# Spotify once the result is older than PLAYBACK_POLL_INTERVAL seconds;
+# concurrent readers share a single in-flight fetch. Nothing runs while nobody
+# reads, and playback commands invalidate the cache so the next read fetches
+# fresh state.
+# ------------------------------------------------------------------------
+PLAYBACK_POLL_INTERVAL = 3.0
+
+_playback_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_playback_fetch: Optional[asyncio.Task] = None
+
+async def _fetch_playback() -> Dict[str, Any]:
+    """
+    Fetch the playback state and cache it, unless the cache was invalidated
+    while the fetch was in flight.
+    """
+    global _playback_cache, _playback_fetch
+    try:
+        result = await _current()
+        if _playback_fetch is asyncio.current_task():
+            _playback_cache = (time.monotonic(), result)
+        return result
+    finally:
+        if _playback_fetch is asyncio.current_task():
+            _playback_fetch = None
+
+def _invalidate_playback() -> None:
+    """
+    Drop the cached playback state (and detach any in-flight fetch) after a
+    playback command, so the next read doesn't return the state from before it.
+    """
+    global _playback_cache, _playback_fetch
+    _playback_cache = None
+    _playback_fetch = None
+
+async def _read_playback() -> Dict[str, Any]:
+    """
+    Return the playback state, fetching it only when the cached result is stale.
+    """
+    global _playback_fetch
+    if _playback_cache is not None and time.monotonic() - _playback_cache[0] < PLAYBACK_POLL_INTERVAL:
+        return _playback_cache[1]
+    if _playback_fetch is None:
+        _playback_fetch = asyncio.create_task(_fetch_playback())
+    # Shielded so a cancelled reader doesn't cancel the fetch other readers share.
+    return await asyncio.shield(_playback_fetch)
 
 # ------------------------------------------------------------------------
 # TOOL DEFINITIONS
@@ -17,7 +110,7 @@ mcp = FastMCP("SpotifyMCP")
 # ------------------------------------------------------------------------
 
 @mcp.tool()
-def search(query: str) -> dict:
+async def search(query: str) -> Union[List[Dict[str, Any]], Dict[str, str]]:
     """
     🔍 Search for tracks on Spotify by query string.
 
@@ -25,15 +118,28 @@ def search(query: str) -> dict:
         query (str): The search term (track name, artist, album, etc.)
 
     Returns:
-        dict: Search results including matching tracks, artists, and albums.
+        list[dict] | dict: Matching tracks (name, artist, album, URI, URL), or an error dict.
 
     Usage:
         Use this tool to find tracks or artists by keyword.
     """
-    return spotify.search(query)
+    return await _search(query)
 
 @mcp.tool()
-def start_playback(track_name: str) -> dict:
+async def clear_search_cache() -> dict:
+    """
+    🧹 Clear cached search results.
+
+    Returns:
+        dict: Status with the number of cleared entries.
+
+    Usage:
+        Search results are cached for a few minutes; use this to force fresh results.
+    """
+    return _clear_search_cache()
+
+@mcp.tool()
+async def start_playback(track_name: str) -> dict:
     """
     ▶️ Start playback for a given track name.
 
@@ -46,10 +152,12 @@ def start_playback(track_name: str) -> dict:
     Usage:
         Initiate playback of a specific track by providing its name.
     """
-    return spotify.start_playback(track_name)
+    result = await _start_playback(track_name)
+    _invalidate_playback()
+    return result
 
 @mcp.tool()
-def get_current_user() -> dict:
+async def get_current_user() -> dict:
     """
     👤 Get the current Spotify user's profile information.
 
@@ -59,10 +167,10 @@ def get_current_user() -> dict:
     Usage:
         Retrieve information about the authenticated Spotify user.
     """
-    return spotify.get_current_user()
+    return await _get_current_user()
 
 @mcp.tool()
-def pause_playback() -> dict:
+async def pause_playback() -> dict:
     """
     ⏸️ Pause the current playback.
 
@@ -72,10 +180,12 @@ def pause_playback() -> dict:
     Usage:
         Temporarily stop the current track without losing position.
     """
-    return spotify.pause_playback()
+    result = await _pause()
+    _invalidate_playback()
+    return result
 
 @mcp.tool()
-def resume_playback() -> dict:
+async def resume_playback() -> dict:
     """
     ▶️ Resume playback if paused.
 
@@ -85,10 +195,12 @@ def resume_playback() -> dict:
     Usage:
         Continue playback from where it was paused.
     """
-    return spotify.resume_playback()
+    result = await _resume()
+    _invalidate_playback()
+    return result
 
 @mcp.tool()
-def next_track() -> dict:
+async def next_track() -> dict:
     """
     ⏭️ Skip to the next track.
 
@@ -98,10 +210,12 @@ def next_track() -> dict:
     Usage:
         Move to the next track in the current playlist or queue.
     """
-    return spotify.next_track()
+    result = await _next()
+    _invalidate_playback()
+    return result
 
 @mcp.tool()
-def previous_track() -> dict:
+async def previous_track() -> dict:
     """
     ⏮️ Return to the previous track.
 
@@ -111,23 +225,25 @@ def previous_track() -> dict:
     Usage:
         Go back to the previous track in the playlist or queue.
     """
-    return spotify.previous_track()
+    result = await _prev()
+    _invalidate_playback()
+    return result
 
 @mcp.tool()
-def get_user_playlists() -> dict:
+async def get_user_playlists() -> Union[List[Dict[str, Any]], Dict[str, str]]:
     """
     📋 Retrieve the user's playlists.
 
     Returns:
-        dict: A list of playlists owned or followed by the user.
+        list[dict] | dict: Playlists owned or followed by the user, or an error dict.
 
     Usage:
         Fetch all playlists associated with the current user account.
     """
-    return spotify.get_user_playlists()
+    return await _playlists()
 
 @mcp.tool()
-def set_player_volume(volume: int) -> dict:
+async def set_player_volume(volume: int) -> dict:
     """
     🔊 Set the Spotify player's volume (0-100).
 
@@ -140,10 +256,10 @@ def set_player_volume(volume: int) -> dict:
     Usage:
         Adjust the playback volume for the current Spotify session.
     """
-    return spotify.set_volume(volume)
+    return await _set_volume(volume)
 
 @mcp.tool()
-def current_playback() -> dict:
+async def current_playback() -> dict:
     """
     🎵 Get info about the currently playing track.
 
@@ -151,9 +267,20 @@ def current_playback() -> dict:
         dict: Details about the current playback, including track, artist, and playback state.
 
     Usage:
-        Retrieve real-time information about what is currently playing.
+        Retrieve information about what is currently playing. Results may be a few
+        seconds old.
+    """
+    return await _read_playback()
+
+@mcp.resource("spotify://playback/current", mime_type="application/json")
+async def playback_resource() -> Dict[str, Any]:
+    """
+    🎵 The currently playing track, as a readable resource.
+
+    Backed by the same shared cache as the current_playback tool, so any number
+    of clients reading it cost at most one upstream request every few seconds.
     """
-    return spotify.get_current_playback()
+    return await _read_playback()
 
 # =============================================================================
 # 🛠️ Developer Notes:
@@ -1,9 +1,20 @@
 import spotipy
+import httpx
+import orjson
 from dotenv import load_dotenv
+import asyncio
+import functools
+import logging
 import os
+import sqlite3
+import time
+from cachetools import TTLCache
+from contextlib import contextmanager, nullcontext
+from spotipy.cache_handler import CacheFileHandler, CacheHandler
 from spotipy.oauth2 import SpotifyOAuth
 from enum import Enum
-from typing import List, Dict, Any, Optional, Union
+from operator import itemgetter
+from typing import List, Dict, Any, Awaitable, Callable, ContextManager, Iterator, Optional, TypeVar, Union
 
 # 🌱 Load environment variables from .env file for secure credential management
 # --------------------------------------------------------------------------------
@@ -21,6 +32,8 @@ load_dotenv()
 CLIENT_ID = os.getenv("CLIENT_ID")
 CLIENT_SECRET = os.getenv("CLIENT_SECRET")
 REDIRECT_URI = os.getenv("REDIRECT_URI")
+TOKEN_CACHE_PATH = os.getenv("TOKEN_CACHE_PATH", ".spotify_token_cache")
+TOKEN_CACHE_DB = os.getenv("TOKEN_CACHE_DB")
 
 class SpotifyScope(Enum):
     """
@@ -52,6 +65,9 @@ class SpotifyError(Enum):
     AUTH_ERROR = "Authentication error"          # Issues with authentication or authorization
     UNKNOWN = "Unknown error"                    # Any other unspecified error
 
+# Error prefixes resolved once, so format_error() doesn't touch Enum.value per call.
+_ERR: Dict[SpotifyError, str] = {error_type: error_type.value for error_type in SpotifyError}
+
 def format_error(message: str, error_type: SpotifyError = SpotifyError.UNKNOWN) -> Dict[str, str]:
     """
     Standardized error formatting.
@@ -66,54 +82,375 @@ def format_error(message: str, error_type: SpotifyError = SpotifyError.UNKNOWN)
     This function ensures that all errors returned by the API have a consistent structure,
     making it easier for clients to handle and display errors.
     """
-    return {"error": f"{error_type.value}: {message}"}
+    return {"error": f"{_ERR[error_type]}: {message}"}
+
+# 📱 Device list cache
+# --------------------------------------------------------------------------------
+# Playback commands tend to arrive in bursts (pause -> next -> volume), and each one
+# checks for an active device first. The devices response is kept for a few seconds
+# so back-to-back commands don't repeat the lookup.
+# --------------------------------------------------------------------------------
+DEVICE_CACHE_TTL = 5.0
 
-def ensure_active_device(sp: spotipy.Spotify) -> Optional[Dict[str, str]]:
+_devices_cache: TTLCache = TTLCache(maxsize=1, ttl=DEVICE_CACHE_TTL)
+
+# Last volume known to be set on the active device. set_volume() skips the request
+# when asked for the same value (e.g. repeated values from a volume slider).
+_last_volume: Optional[int] = None
+
+def invalidate_device_cache(error: Optional[Exception] = None) -> None:
     """
-    Check if there is an active device for playback.
+    Drop the cached devices response.
 
     Args:
-        sp (spotipy.Spotify): An authenticated Spotipy client instance.
+        error (Exception, optional): When given, the cache is only dropped if the error
+            is a Spotify 404, which is how the API reports a missing or stale device.
+    """
+    global _last_volume
+    if error is None or (isinstance(error, spotipy.SpotifyException) and error.http_status == 404):
+        _devices_cache.clear()
+        _last_volume = None
+
+async def ensure_active_device() -> Optional[Dict[str, str]]:
+    """
+    Check if there is an active device for playback.
 
     Returns:
         dict | None: Returns an error dict if no active device is found, otherwise None.
 
     This utility function checks whether the user has an active Spotify device (such as
     a phone, desktop app, or web player) available for playback. Many Spotify API playback
-    endpoints require an active device. If no device is found, an error is returned.
+    endpoints require an active device. A non-empty devices response is cached for
+    DEVICE_CACHE_TTL seconds, and each fresh response resyncs the known volume with the
+    active device. If no device is found, an error is returned.
     """
-    devices = sp.devices()
-    if not devices.get("devices"):
-        return format_error("Please open Spotify on a device and try again.", SpotifyError.NO_ACTIVE_DEVICE)
+    global _last_volume
+    devices = _devices_cache.get("devices")
+    if devices is None:
+        devices = await _request("GET", "/me/player/devices")
+        if not devices.get("devices"):
+            _last_volume = None
+            return format_error("Please open Spotify on a device and try again.", SpotifyError.NO_ACTIVE_DEVICE)
+        _devices_cache["devices"] = devices
+        active = next((device for device in devices["devices"] if device.get("is_active")), None)
+        _last_volume = active.get("volume_percent") if active else None
     return None
 
 # 🎧 Define the required Spotify API scopes for playback and user info
 # --------------------------------------------------------------------------------
 # The SCOPE variable is a space-separated string of all required permissions for this
-# application. It is passed to the SpotifyOAuth object to request the necessary access
-# from the user during authentication.
+# application (the values of SpotifyScope). It is passed to the SpotifyOAuth object to
+# request the necessary access from the user during authentication.
 # --------------------------------------------------------------------------------
-SCOPE = " ".join([
-    SpotifyScope.USER_READ_PRIVATE.value,
-    SpotifyScope.USER_READ_EMAIL.value,
-    SpotifyScope.USER_LIBRARY_READ.value,
-    SpotifyScope.USER_READ_PLAYBACK_STATE.value,
-    SpotifyScope.USER_MODIFY_PLAYBACK_STATE.value,
-])
-
-# 🚀 Initialize the Spotipy client with OAuth authentication
+SCOPE = (
+    "user-read-private user-read-email user-library-read "
+    "user-read-playback-state user-modify-playback-state"
+)
+
+class LockingCacheHandler(CacheHandler):
+    """
+    Token cache that can serialize token refreshes across processes.
+
+    refresh_lock() is held while a token is refreshed. The default does no locking,
+    which is all a cache used by a single process needs.
+    """
+
+    def refresh_lock(self) -> ContextManager[None]:
+        return nullcontext()
+
+class FileCacheHandler(CacheFileHandler, LockingCacheHandler):
+    """
+    Spotipy's JSON file cache (one process per file, so no refresh lock).
+    """
+
+class SQLiteCacheHandler(LockingCacheHandler):
+    """
+    Token cache backed by a SQLite database in WAL mode.
+
+    Unlike the default file cache, one database can be shared by several server
+    processes (e.g. multiple workers). refresh_lock() holds the database write lock
+    while a token is refreshed, so only one process refreshes and the others pick up
+    the saved token instead of refreshing it again.
+    """
+
+    def __init__(self, path: str, key: str = "spotify:token") -> None:
+        self.key = key
+        # Autocommit mode: writes commit immediately unless refresh_lock() opened a
+        # transaction, in which case they are committed when the lock is released.
+        # Token loads run in worker threads, one at a time, so the connection is
+        # shared across threads.
+        self._conn = sqlite3.connect(path, isolation_level=None, timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS tokens (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    def get_cached_token(self) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute("SELECT value FROM tokens WHERE key = ?", (self.key,)).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def save_token_to_cache(self, token_info: Dict[str, Any]) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO tokens (key, value) VALUES (?, ?)",
+            (self.key, orjson.dumps(token_info).decode()),
+        )
+
+    @contextmanager
+    def refresh_lock(self) -> Iterator[None]:
+        """
+        Serialize token refreshes across processes sharing the database.
+        """
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+# 🚀 Initialize OAuth authentication and the shared HTTP client
 # --------------------------------------------------------------------------------
-# The Spotipy client is initialized with OAuth authentication, using the credentials
-# and scopes defined above. This client is used for all subsequent Spotify API calls.
+# Spotipy's SpotifyOAuth handles the authorization flow and token refreshes, while
+# the Web API itself is called through a single long-lived httpx.AsyncClient. Reusing
+# one client keeps connections alive between tool calls, so only the first request
+# pays for the TCP and TLS handshake, and concurrent tool calls can overlap their I/O.
+# The token is persisted to TOKEN_CACHE_PATH, or to the SQLite database at
+# TOKEN_CACHE_DB when several processes should share it, and kept in memory between
+# refreshes.
 # --------------------------------------------------------------------------------
-sp = spotipy.Spotify(auth_manager=SpotifyOAuth(
+API_BASE_URL = "https://api.spotify.com/v1"
+
+cache_handler: LockingCacheHandler = (
+    SQLiteCacheHandler(TOKEN_CACHE_DB) if TOKEN_CACHE_DB
+    else FileCacheHandler(cache_path=TOKEN_CACHE_PATH)
+)
+
+auth_manager = SpotifyOAuth(
     client_id=CLIENT_ID,
     client_secret=CLIENT_SECRET,
     redirect_uri=REDIRECT_URI,
-    scope=SCOPE
-))
+    scope=SCOPE,
+    cache_handler=cache_handler
+)
+
+# httpx logs every request URL at INFO, and FastMCP configures logging at INFO. That
+# would print each call, including users' search text, to the server log.
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+def _new_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=API_BASE_URL,
+        limits=httpx.Limits(max_keepalive_connections=20),
+        timeout=10.0,
+    )
+
+_client = _new_client()
+
+# 🚦 Client-side rate limiting
+# --------------------------------------------------------------------------------
+# Tool calls run concurrently, so outgoing requests are capped by a semaphore and
+# spaced out leaky-bucket style to stay below Spotify's rate limit instead of
+# running into 429 responses.
+# --------------------------------------------------------------------------------
+MAX_CONCURRENT_REQUESTS = 5
+RATE_LIMIT = 20.0  # requests per second
+
+_request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+_next_request_at = 0.0
+
+async def _throttle() -> None:
+    """
+    Wait for the next free request slot (one every 1 / RATE_LIMIT seconds).
+    """
+    global _next_request_at
+    now = time.monotonic()
+    wait = _next_request_at - now
+    _next_request_at = max(now, _next_request_at) + 1.0 / RATE_LIMIT
+    if wait > 0:
+        await asyncio.sleep(wait)
+
+# 🔁 Retry with exponential backoff
+# --------------------------------------------------------------------------------
+# 429 (rate limited) and 5xx responses are usually transient. Instead of surfacing
+# them to the user right away, the request is retried after the delay given in the
+# Retry-After header, or after an exponential backoff when the header is missing.
+# Server errors are only retried for idempotent methods: the player endpoints often
+# answer 502 even though the command went through, and repeating a POST such as
+# /me/player/next would skip a second track.
+# --------------------------------------------------------------------------------
+MAX_RETRY_DELAY = 30.0
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT"})
 
-def search(query: str) -> Union[List[Dict[str, Any]], Dict[str, str]]:
+T = TypeVar("T")
+
+def _is_retryable(error: spotipy.SpotifyException, method: str) -> bool:
+    """
+    Whether a Spotify error is worth retrying: rate limiting for any method, server
+    errors only for idempotent methods.
+    """
+    if error.http_status == 429:
+        return True
+    return error.http_status >= 500 and method.upper() in IDEMPOTENT_METHODS
+
+def with_retry(max_retries: int = 3, base: float = 0.5) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Retry an async Spotify call on 429 and 5xx errors.
+
+    The decorated coroutine takes the HTTP method as its first argument (positional or
+    method=...), which decides whether server errors are retried (see _is_retryable).
+    Without a method, only 429 responses are retried.
+
+    Args:
+        max_retries (int, optional): Retries after the first attempt. Defaults to 3.
+        base (float, optional): Base delay in seconds for the exponential backoff
+            (base * 2 ** attempt), used when no Retry-After header is sent. Defaults to 0.5.
+
+    Returns:
+        Callable: A decorator for coroutine functions. Delays are capped at MAX_RETRY_DELAY.
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            method = kwargs.get("method", args[0] if args else "")
+            attempt = 0
+            while True:
+                try:
+                    return await func(*args, **kwargs)
+                except spotipy.SpotifyException as e:
+                    if attempt >= max_retries or not _is_retryable(e, method):
+                        raise
+                    retry_after = (e.headers or {}).get("Retry-After")
+                    try:
+                        delay = float(retry_after)
+                    except (TypeError, ValueError):
+                        delay = base * 2 ** attempt
+                    await asyncio.sleep(min(delay, MAX_RETRY_DELAY))
+                    attempt += 1
+        return wrapper
+    return decorator
+
+_token_info: Optional[Dict[str, Any]] = None
+_token_lock = asyncio.Lock()
+
+def _token_expired() -> bool:
+    return _token_info is None or auth_manager.is_token_expired(_token_info)
+
+def _load_token() -> Dict[str, Any]:
+    """
+    Load the token from the cache, refreshing it through Spotipy if needed.
+
+    This is blocking (file or database access plus an HTTPS call to the accounts
+    service), so async code runs it in a worker thread. Refreshes run under the cache
+    handler's refresh_lock(); with a shared cache, a token saved meanwhile by another
+    process is picked up instead of being refreshed again. The first-time authorization
+    is interactive (browser login), so it is not run under the lock, where it could
+    stall the other processes.
+    """
+    lock = cache_handler.refresh_lock() if cache_handler.get_cached_token() else nullcontext()
+    with lock:
+        token = auth_manager.get_access_token(as_dict=False)
+        return cache_handler.get_cached_token() or {"access_token": token, "expires_at": 0}
+
+async def _access_token() -> str:
+    """
+    Return the current access token, refreshing it only when it is about to expire.
+
+    The token is kept in memory, so the cache is only read (and the token only
+    refreshed) when the in-memory copy is missing or expired. The refresh runs off the
+    event loop, and concurrent callers share a single refresh.
+    """
+    global _token_info
+    if _token_expired():
+        async with _token_lock:
+            if _token_expired():
+                _token_info = await asyncio.to_thread(_load_token)
+    return _token_info["access_token"]
+
+async def _auth_headers() -> Dict[str, str]:
+    """
+    Build the Authorization header from the current (refreshed if needed) access token.
+    """
+    return {"Authorization": f"Bearer {await _access_token()}"}
+
+@with_retry()
+async def _request(method: str, path: str, **kwargs: Any) -> Optional[Dict[str, Any]]:
+    """
+    Send a request to the Spotify Web API.
+
+    Args:
+        method (str): HTTP method, e.g. "GET" or "PUT".
+        path (str): Endpoint path relative to API_BASE_URL, e.g. "/me/player/pause".
+        **kwargs: Extra arguments forwarded to httpx (params, json, ...).
+
+    Returns:
+        dict | None: The JSON body (decoded with orjson), or None for empty responses.
+
+    Raises:
+        spotipy.SpotifyException: If the API answers with an error status, so callers
+        can keep handling failures the same way as with the Spotipy client. Rate-limit
+        and server errors are retried first (see with_retry).
+    """
+    async with _request_semaphore:
+        await _throttle()
+        response = await _client.request(method, path, headers=await _auth_headers(), **kwargs)
+    if response.status_code >= 400:
+        try:
+            message = orjson.loads(response.content)["error"]["message"]
+        except (ValueError, KeyError, TypeError):
+            message = response.text
+        raise spotipy.SpotifyException(
+            response.status_code,
+            -1,
+            f"{response.request.url}:\n {message}",
+            headers=response.headers,
+        )
+    if not response.content:
+        return None
+    return orjson.loads(response.content)
+
+# 🗄️ Short-lived response caches
+# --------------------------------------------------------------------------------
+# Profile data practically never changes during a session and playlists change
+# rarely, so both are memoized for a TTL window to skip the HTTPS round-trip on
+# repeated tool calls. Error results are never cached.
+# --------------------------------------------------------------------------------
+USER_CACHE_TTL = 3600.0
+PLAYLISTS_CACHE_TTL = 60.0
+
+_user_cache: TTLCache = TTLCache(maxsize=1, ttl=USER_CACHE_TTL)
+_playlists_cache: TTLCache = TTLCache(maxsize=1, ttl=PLAYLISTS_CACHE_TTL)
+
+# Recent search results, keyed by normalized query. Repeated searches are answered
+# from here, and start_playback() looks here first so the common "search, then play"
+# flow needs only one search request.
+SEARCH_CACHE_TTL = 300.0
+
+_search_cache: TTLCache = TTLCache(maxsize=256, ttl=SEARCH_CACHE_TTL)
+
+# 🧲 Precompiled field getters for the result builders below. itemgetter runs the
+# lookups in C, which adds up over large result pages.
+_name = itemgetter("name")
+_spotify_url = itemgetter("spotify")
+_total = itemgetter("total")
+_track_fields = itemgetter("name", "uri", "artists", "album", "external_urls")
+_playlist_fields = itemgetter("name", "external_urls", "id", "tracks")
+
+def clear_search_cache() -> Dict[str, str]:
+    """
+    🧹 Drop all cached search results.
+
+    Returns:
+        dict: Status with the number of cleared entries.
+    """
+    cleared = len(_search_cache)
+    _search_cache.clear()
+    return {"status": f"Cleared {cleared} cached searches"}
+
+def _normalize_query(query: str) -> str:
+    """
+    Normalize a search query for use as a cache key.
+    """
+    return query.strip().lower()
+
+async def search(query: str) -> Union[List[Dict[str, Any]], Dict[str, str]]:
     """
     🔍 Search for tracks on Spotify.
 
@@ -125,29 +462,36 @@ def search(query: str) -> Union[List[Dict[str, Any]], Dict[str, str]]:
 
     This function performs a search for tracks on Spotify using the provided query.
     It returns up to 5 matching tracks, each represented as a dictionary containing
-    the track's name, artist, album, URI, and Spotify URL. If no tracks are found,
-    or if an error occurs, a standardized error dictionary is returned.
+    the track's name, artist, album, URI, and Spotify URL. Results are cached for
+    SEARCH_CACHE_TTL seconds per normalized query. If no tracks are found, or if an
+    error occurs, a standardized error dictionary is returned.
     """
+    key = _normalize_query(query)
+    cached = _search_cache.get(key)
+    if cached is not None:
+        return cached
     try:
-        results = sp.search(q=query, limit=5, type='track')
-        tracks = []
-        for item in results["tracks"]["items"]:
-            # 🎼 Collect essential track info for each result
-            track = {
-                "name": item["name"],
-                "artist": item["artists"][0]["name"],
-                "album": item["album"]["name"],
-                "uri": item["uri"],
-                "url": item["external_urls"]["spotify"]
+        results = await _request("GET", "/search", params={"q": query, "limit": 5, "type": "track"})
+        items = results["tracks"]["items"]
+        # 🎼 Collect essential track info for each result
+        tracks = [
+            {
+                "name": name,
+                "artist": _name(artists[0]),
+                "album": _name(album),
+                "uri": uri,
+                "url": _spotify_url(external_urls)
             }
-            tracks.append(track)
+            for name, uri, artists, album, external_urls in map(_track_fields, items)
+        ]
         if not tracks:
             return format_error("No tracks found for your query.", SpotifyError.NO_TRACKS_FOUND)
+        _search_cache[key] = tracks
         return tracks
     except Exception as e:
         return format_error(str(e))
 
-def start_playback(track: str) -> Dict[str, Any]:
+async def start_playback(track: str) -> Dict[str, Any]:
     """
     ▶️ Start playback for a given track name.
 
@@ -158,29 +502,37 @@ def start_playback(track: str) -> Dict[str, Any]:
         dict: Playback status or error.
 
     This function searches for the specified track and starts playback on the user's
-    active Spotify device. If no device is active, or if the track is not found, an
-    error is returned. On success, it returns the status and details of the playing track.
+    active Spotify device. If the same query was recently passed to search(), its top
+    hit is reused instead of searching again. If no device is active, or if the track
+    is not found, an error is returned. On success, it returns the status and details
+    of the playing track.
     """
     try:
-        device_error = ensure_active_device(sp)
+        device_error = await ensure_active_device()
         if device_error:
             return device_error
-        results = sp.search(q=track, limit=1, type='track')
-        if not results["tracks"]["items"]:
-            return format_error("No tracks found for playback.", SpotifyError.NO_TRACKS_FOUND)
-        track_uri = results['tracks']['items'][0]['uri']
-        sp.start_playback(uris=[track_uri])
+        cached = _search_cache.get(_normalize_query(track))
+        if cached:
+            top_hit = cached[0]
+        else:
+            results = await _request("GET", "/search", params={"q": track, "limit": 1, "type": "track"})
+            if not results["tracks"]["items"]:
+                return format_error("No tracks found for playback.", SpotifyError.NO_TRACKS_FOUND)
+            item = results['tracks']['items'][0]
+            top_hit = {"name": item['name'], "artist": item['artists'][0]['name'], "uri": item['uri']}
+        await _request("PUT", "/me/player/play", json={"uris": [top_hit['uri']]})
         return {
             "status": "playing",
-            "track": results['tracks']['items'][0]['name'],
-            "artist": results['tracks']['items'][0]['artists'][0]['name']
+            "track": top_hit['name'],
+            "artist": top_hit['artist']
         }
     except spotipy.SpotifyException as e:
+        invalidate_device_cache(e)
         return format_error(str(e), SpotifyError.AUTH_ERROR)
     except Exception as e:
         return format_error(str(e))
 
-def get_current_user() -> Dict[str, Any]:
+async def get_current_user() -> Dict[str, Any]:
     """
     👤 Fetch the current Spotify user's profile.
 
@@ -188,20 +540,25 @@ def get_current_user() -> Dict[str, Any]:
         dict: User info or error.
 
     This function retrieves the profile information of the currently authenticated
-    Spotify user, including their display name, email, and user ID. If authentication
-    fails, an error is returned.
+    Spotify user, including their display name, email, and user ID. The profile is
+    cached for USER_CACHE_TTL seconds. If authentication fails, an error is returned.
     """
+    cached = _user_cache.get("me")
+    if cached is not None:
+        return cached
     try:
-        user_info = sp.current_user()
-        return {
+        user_info = await _request("GET", "/me")
+        result = {
             "display_name": user_info.get("display_name"),
             "email": user_info.get("email"),
             "id": user_info.get("id")
         }
+        _user_cache["me"] = result
+        return result
     except Exception as e:
         return format_error(str(e), SpotifyError.AUTH_ERROR)
 
-def pause_playback() -> Dict[str, str]:
+async def pause_playback() -> Dict[str, str]:
     """
     ⏸️ Pause the current playback.
 
@@ -212,15 +569,16 @@ def pause_playback() -> Dict[str, str]:
     is active, or if an error occurs, a standardized error is returned.
     """
     try:
-        device_error = ensure_active_device(sp)
+        device_error = await ensure_active_device()
         if device_error:
             return device_error
-        sp.pause_playback()
+        await _request("PUT", "/me/player/pause")
         return {"status": "paused"}
     except Exception as e:
+        invalidate_device_cache(e)
         return format_error(str(e))
 
-def resume_playback() -> Dict[str, str]:
+async def resume_playback() -> Dict[str, str]:
     """
     ▶️ Resume playback if paused.
 
@@ -231,15 +589,16 @@ def resume_playback() -> Dict[str, str]:
     If no device is active, or if an error occurs, a standardized error is returned.
     """
     try:
-        device_error = ensure_active_device(sp)
+        device_error = await ensure_active_device()
         if device_error:
             return device_error
-        sp.start_playback()
+        await _request("PUT", "/me/player/play")
         return {"status": "resumed"}
     except Exception as e:
+        invalidate_device_cache(e)
         return format_error(str(e))
 
-def next_track() -> Dict[str, str]:
+async def next_track() -> Dict[str, str]:
     """
     ⏭️ Skip to the next track.
 
@@ -250,15 +609,16 @@ def next_track() -> Dict[str, str]:
     device. If no device is active, or if an error occurs, a standardized error is returned.
     """
     try:
-        device_error = ensure_active_device(sp)
+        device_error = await ensure_active_device()
         if device_error:
             return device_error
-        sp.next_track()
+        await _request("POST", "/me/player/next")
         return {"status": "skipped to next"}
     except Exception as e:
+        invalidate_device_cache(e)
         return format_error(str(e))
 
-def previous_track() -> Dict[str, str]:
+async def previous_track() -> Dict[str, str]:
     """
     ⏮️ Return to the previous track.
 
@@ -269,44 +629,61 @@ def previous_track() -> Dict[str, str]:
     active device. If no device is active, or if an error occurs, a standardized error is returned.
     """
     try:
-        device_error = ensure_active_device(sp)
+        device_error = await ensure_active_device()
         if device_error:
             return device_error
-        sp.previous_track()
+        await _request("POST", "/me/player/previous")
         return {"status": "returned to previous"}
     except Exception as e:
+        invalidate_device_cache(e)
         return format_error(str(e))
 
-def get_user_playlists() -> Union[List[Dict[str, Any]], Dict[str, str]]:
+PLAYLISTS_PAGE_SIZE = 50  # maximum page size allowed by the API
+
+async def get_user_playlists() -> Union[List[Dict[str, Any]], Dict[str, str]]:
     """
     📋 Retrieve the user's playlists.
 
     Returns:
         list[dict] | dict: List of playlists or error.
 
-    This function fetches all playlists owned or followed by the current user. Each
-    playlist is represented as a dictionary containing its name, Spotify URL, ID, and
-    the total number of tracks. If no playlists are found, or if an error occurs, a
-    standardized error is returned.
+    This function fetches all playlists owned or followed by the current user. The first
+    page reports the total count, and all remaining pages are then requested
+    concurrently (subject to the client-side rate limit). Each playlist is represented
+    as a dictionary containing its name, Spotify URL, ID, and the total number of
+    tracks. The list is cached for PLAYLISTS_CACHE_TTL seconds. If no playlists are
+    found, or if an error occurs, a standardized error is returned.
     """
+    cached = _playlists_cache.get("me")
+    if cached is not None:
+        return cached
     try:
-        playlists = sp.current_user_playlists()
-        result = []
-        for playlist in playlists['items']:
-            playlist_info = {
-                "name": playlist['name'],
-                "url": playlist['external_urls']['spotify'],
-                "id": playlist['id'],
-                "tracks_total": playlist['tracks']['total']
+        first_page = await _request("GET", "/me/playlists", params={"limit": PLAYLISTS_PAGE_SIZE, "offset": 0})
+        items = first_page['items']
+        offsets = range(PLAYLISTS_PAGE_SIZE, first_page['total'], PLAYLISTS_PAGE_SIZE)
+        pages = await asyncio.gather(*(
+            _request("GET", "/me/playlists", params={"limit": PLAYLISTS_PAGE_SIZE, "offset": offset})
+            for offset in offsets
+        ))
+        for page in pages:
+            items.extend(page['items'])
+        result = [
+            {
+                "name": name,
+                "url": _spotify_url(external_urls),
+                "id": playlist_id,
+                "tracks_total": _total(tracks)
             }
-            result.append(playlist_info)
+            for name, external_urls, playlist_id, tracks in map(_playlist_fields, items)
+        ]
         if not result:
             return format_error("No playlists found.")
+        _playlists_cache["me"] = result
         return result
     except Exception as e:
         return format_error(str(e))
 
-def set_volume(volume: int) -> Dict[str, str]:
+async def set_volume(volume: int) -> Dict[str, str]:
     """
     🔊 Set the Spotify player's volume.
 
@@ -317,21 +694,28 @@ def set_volume(volume: int) -> Dict[str, str]:
         dict: Volume status or error.
 
     This function sets the playback volume on the user's active device. The volume must
-    be an integer between 0 and 100. If the value is out of range, or if no device is
-    active, a standardized error is returned.
+    be an integer between 0 and 100. If the device is already at the requested volume,
+    no request is sent. If the value is out of range, or if no device is active, a
+    standardized error is returned.
     """
-    if not isinstance(volume, int) or volume < 0 or volume > 100:
+    global _last_volume
+    if not (isinstance(volume, int) and 0 <= volume <= 100):
         return format_error("Volume must be an integer between 0 and 100", SpotifyError.INVALID_VOLUME)
     try:
-        device_error = ensure_active_device(sp)
+        device_error = await ensure_active_device()
         if device_error:
             return device_error
-        sp.volume(volume)
+        if volume == _last_volume:
+            return {"status": f"Volume already at {volume}"}
+        await _request("PUT", "/me/player/volume", params={"volume_percent": volume})
+        _last_volume = volume
         return {"status": f"Volume set to {volume}"}
     except Exception as e:
+        _last_volume = None
+        invalidate_device_cache(e)
         return format_error(str(e))
 
-def get_current_playback() -> Dict[str, Any]:
+async def get_current_playback() -> Dict[str, Any]:
     """
     🎵 Get info about the currently playing track.
 
@@ -340,11 +724,12 @@ def get_current_playback() -> Dict[str, Any]:
 
     This function retrieves information about the currently playing track, including
     whether playback is active, the track's name, artist, album, progress in milliseconds,
-    and total duration. If nothing is playing, or if an error occurs, a standardized
-    error is returned.
+    and total duration. It uses the currently-playing endpoint, which omits the device
+    block that /me/player returns. If nothing is playing, or if an error occurs, a
+    standardized error is returned.
     """
     try:
-        playback = sp.current_playback()
+        playback = await _request("GET", "/me/player/currently-playing")
         if playback is None or playback.get('item') is None:
             return format_error("Nothing is playing.", SpotifyError.NOTHING_PLAYING)
         track = playback['item']
@@ -360,6 +745,44 @@ def get_current_playback() -> Dict[str, Any]:
     except Exception as e:
         return format_error(str(e))
 
+async def warm_up() -> None:
+    """
+    🔥 Open the pooled connection to the Web API before the first tool call.
+
+    Fetches the current user's profile, which pays the TCP and TLS handshake up front
+    and fills the profile cache as a side effect. Skipped when no token was loaded at
+    import, since fetching one would start the interactive first-time authorization.
+    Errors are ignored here; tool calls report them in the usual format.
+    """
+    if _token_info is None:
+        return
+    await get_current_user()
+
+async def close() -> None:
+    """
+    Close the shared HTTP client and its pooled connections.
+
+    A fresh client (with no open connections) takes its place, so the module keeps
+    working if the server starts serving again afterwards.
+    """
+    global _client
+    client, _client = _client, _new_client()
+    await client.aclose()
+
+# 🔥 Pre-warm the access token
+# --------------------------------------------------------------------------------
+# Load (and refresh if needed) the token once at import, so the first tool call
+# doesn't pay for the OAuth refresh. Only a cached token is pre-warmed: without one,
+# Spotipy would start the interactive first-time authorization during import, which
+# blocks startup and can read from stdin (the MCP transport). Failures are ignored
+# here; the first tool call retries and reports the error in the usual format.
+# --------------------------------------------------------------------------------
+try:
+    if cache_handler.get_cached_token():
+        _token_info = _load_token()
+except Exception:
+    pass
+
 # 🛠️ Developer Notes:
 # --------------------------------------------------------------------------------
 # - All functions return either a dict or a list of dicts for easy JSON serialization.
@@ -371,4 +794,3 @@ def get_current_playback() -> Dict[str, Any]:
 # - For more information on the Spotify Web API, see:
 #   https://developer.spotify.com/documentation/web-api/
 # --------------------------------------------------------------------------------
-